@@ -0,0 +1,91 @@
+import argparse
+from collections import OrderedDict
+
+from telemetry import TELEMETRY_DIR, read_events
+
+SURVIVAL_STEP = 15  # Seconds between points on the survival curve
+
+def collect_runs(events):
+    # Split each session's event stream into runs (run_start .. game_over / run_end)
+    sessions = OrderedDict()
+    open_runs = {}
+    for event in events:
+        session = event.get("s")
+        kind = event.get("e")
+        stats = sessions.setdefault(session, {"shots": 0, "hits": 0, "misses": 0, "dropped": 0, "runs": []})
+
+        if kind in ("run_start", "run_resume"):
+            open_runs[session] = {"start": event["t"], "shots": 0, "hits": 0, "level": 1}
+            continue
+
+        run = open_runs.get(session)
+        if kind in ("shot", "hit", "miss"):
+            key = {"shot": "shots", "hit": "hits", "miss": "misses"}[kind]
+            stats[key] += 1
+            if run is not None and key in run:
+                run[key] += 1
+        elif kind == "dropped":
+            stats["dropped"] += event.get("n", 0)
+        elif kind == "level_up" and run is not None:
+            run["level"] = event.get("level", run["level"])
+        elif kind in ("game_over", "run_end") and run is not None:
+            run["duration"] = event["t"] - run["start"]
+            run["died"] = kind == "game_over"
+            run["score"] = event.get("score")
+            stats["runs"].append(run)
+            del open_runs[session]
+    return sessions
+
+def accuracy(hits, shots):
+    return hits / shots if shots else 0.0
+
+def survival_curve(durations, step=SURVIVAL_STEP):
+    # Fraction of finished runs still alive at each time step
+    if not durations:
+        return []
+    curve = []
+    t = 0
+    while True:
+        alive = sum(1 for duration in durations if duration >= t)
+        curve.append((t, alive / len(durations)))
+        if alive == 0:
+            return curve
+        t += step
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarise Asteroid Shooter telemetry logs")
+    parser.add_argument("--dir", default=TELEMETRY_DIR, help="telemetry directory")
+    parser.add_argument("--step", type=int, default=SURVIVAL_STEP, help="survival curve step in seconds")
+    args = parser.parse_args()
+
+    sessions = collect_runs(read_events(args.dir))
+    if not sessions:
+        print(f"No telemetry found in {args.dir}")
+        return
+
+    print("SESSIONS:")
+    total_shots = total_hits = total_dropped = 0
+    deaths = []
+    for session, stats in sessions.items():
+        total_shots += stats["shots"]
+        total_hits += stats["hits"]
+        total_dropped += stats["dropped"]
+        deaths.extend(run["duration"] for run in stats["runs"] if run["died"])
+        print(f"  {session}: runs={len(stats['runs'])} shots={stats['shots']} hits={stats['hits']} "
+              f"misses={stats['misses']} accuracy={accuracy(stats['hits'], stats['shots']):.1%} "
+              f"dropped={stats['dropped']}")
+        for i, run in enumerate(stats["runs"]):
+            ending = "game over" if run["died"] else "quit"
+            print(f"    run {i + 1}: {run['duration']:.1f}s level={run['level']} score={run['score']} "
+                  f"accuracy={accuracy(run['hits'], run['shots']):.1%} ({ending})")
+
+    print(f"\nOverall accuracy: {accuracy(total_hits, total_shots):.1%} ({total_hits}/{total_shots})")
+    if total_dropped:
+        print(f"Warning: {total_dropped} events were dropped by a full telemetry buffer, stats are incomplete")
+
+    print(f"\nSURVIVAL ({len(deaths)} runs ending in game over):")
+    for t, alive in survival_curve(deaths, args.step):
+        print(f"  {t:>5}s  {alive:6.1%}  {'#' * int(alive * 40)}")
+
+if __name__ == "__main__":
+    main()
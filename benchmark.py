@@ -0,0 +1,211 @@
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+# Run without a window or sound device
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+import main
+from telemetry import Telemetry
+
+# Benchmark settings
+BASELINE_FILE = "bench_baseline.json"
+DEFAULT_ITERATIONS = 100
+DEFAULT_WARMUP = 20
+DEFAULT_REPEATS = 10  # Short runs per scenario; the fastest median of each phase is kept
+DEFAULT_SEED = 1234
+DEFAULT_TOLERANCE = 0.25  # Allowed slowdown over the baseline (25%)
+NOISE_FLOOR_US = 10.0  # Differences smaller than this are never regressions
+SWARM_ASTEROIDS = 60  # Asteroids kept on screen in the swarm scenarios
+
+# Exit codes
+EXIT_OK = 0
+EXIT_REGRESSION = 1
+EXIT_NO_BASELINE = 2
+
+PHASES = ("update", "check_collisions", "draw")
+
+def setup_menu_idle(game):
+    game.current_state = main.MENU_STATE
+
+def setup_early_game(game):
+    game.start_game()
+    game.score = 10
+    game.lives = 10 ** 9  # Keep the run going for every iteration
+
+def setup_swarm(game):
+    game.start_game()
+    game.score = 10 ** 6
+    game.lives = 10 ** 9
+    game.difficulty_level = 50
+    game.apply_level()
+    game.points_for_next_level = 10 ** 9
+    game.current_spawn_rate = main.MAX_SPAWN_RATE
+    game.current_asteroid_speed = main.MAX_ASTEROID_SPEED
+    game.player.resize(main.MAX_PLAYER_WIDTH, main.MAX_PLAYER_HEIGHT)
+    step_swarm(game)
+
+def step_swarm(game):
+    # Top the screen back up so every timed frame carries the full swarm
+    while len(game.asteroids) < SWARM_ASTEROIDS:
+        asteroid_x = random.randint(0, main.SCREEN_WIDTH - main.ASTEROID_WIDTH)
+        asteroid_y = random.uniform(-main.ASTEROID_HEIGHT, main.SCREEN_HEIGHT - 200)
+        game.asteroids.append(main.Asteroid(asteroid_x, asteroid_y, main.MAX_ASTEROID_SPEED))
+
+def setup_rapid_fire(game):
+    setup_early_game(game)
+    game.score = 10 ** 6
+    game.points_for_next_level = 10 ** 9
+
+def step_rapid_fire(game):
+    # One shot per frame, through the real key handler
+    game.handle_game_events(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+
+def setup_game_over(game):
+    setup_swarm(game)
+    game.game_over = True
+    game.game_over_explosion = main.Explosion(game.player.x, game.player.y)
+
+# name: (setup, per-iteration step or None)
+SCENARIOS = {
+    "menu_idle": (setup_menu_idle, None),
+    "early_game": (setup_early_game, None),
+    "swarm": (setup_swarm, step_swarm),
+    "rapid_fire": (setup_rapid_fire, step_rapid_fire),
+    "game_over": (setup_game_over, None),
+}
+
+def make_game():
+    game = main.Game(telemetry=Telemetry(enabled=False))
+    # Never touch the player's high scores or saved run
+    game.save_high_scores = lambda score, level: None
+    game.save_snapshot = lambda: None
+    game.discard_snapshot = lambda: None
+    game.has_snapshot = False
+    return game
+
+def run_scenario(game, name, iterations, warmup, seed):
+    setup, step = SCENARIOS[name]
+    random.seed(seed)
+    game.restart_game()
+    game.current_state = main.MENU_STATE
+    setup(game)
+
+    # Time check_collisions on its own; update is reported without it
+    collision_times = []
+    check_collisions = game.check_collisions
+
+    def timed_check_collisions():
+        start = time.perf_counter_ns()
+        check_collisions()
+        collision_times.append(time.perf_counter_ns() - start)
+
+    game.check_collisions = timed_check_collisions
+    samples = {phase: [] for phase in PHASES}
+    try:
+        for i in range(warmup + iterations):
+            if step:
+                step(game)
+            del collision_times[:]
+
+            start = time.perf_counter_ns()
+            game.update()
+            update_time = time.perf_counter_ns() - start
+
+            start = time.perf_counter_ns()
+            game.draw()
+            draw_time = time.perf_counter_ns() - start
+
+            if i >= warmup:
+                collision_time = sum(collision_times)
+                samples["update"].append(update_time - collision_time)
+                samples["check_collisions"].append(collision_time)
+                samples["draw"].append(draw_time)
+    finally:
+        del game.check_collisions
+
+    # Median per call in microseconds, robust to the odd scheduler hiccup
+    return {phase: statistics.median(times) / 1000 for phase, times in samples.items()}
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    missing = []
+    for name, phases in results.items():
+        for phase, value in phases.items():
+            base = baseline.get(name, {}).get(phase)
+            if base is None:
+                missing.append((name, phase))
+            elif value > base * (1 + tolerance) and value - base > NOISE_FLOOR_US:
+                regressions.append((name, phase, base, value))
+    return regressions, missing
+
+def main_benchmark():
+    parser = argparse.ArgumentParser(description="Benchmark Asteroid Shooter frame and tick costs")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="scenario to run (repeatable, default: all)")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS,
+                        help="runs per scenario, the fastest median of each phase is kept")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="baseline JSON file")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed slowdown as a fraction, e.g. 0.25 for 25%%")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+    args = parser.parse_args()
+
+    game = make_game()
+    names = args.scenario or list(SCENARIOS)
+    results = {}
+    # Cycle through the scenarios on each repeat so a burst of machine noise hits
+    # one repeat of several scenarios instead of every repeat of one. Noise only
+    # ever adds time, so the fastest repeat is the most reproducible figure.
+    for _ in range(max(1, args.repeats)):
+        for name in names:
+            phases = run_scenario(game, name, args.iterations, args.warmup, args.seed)
+            best = results.setdefault(name, phases)
+            for phase, value in phases.items():
+                best[phase] = min(best[phase], value)
+    pygame.quit()
+
+    print(f"{'scenario':<12} {'update':>10} {'collisions':>12} {'draw':>10}   (best median us per frame)")
+    for name, phases in results.items():
+        print(f"{name:<12} {phases['update']:>10.1f} {phases['check_collisions']:>12.1f} {phases['draw']:>10.1f}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+        print(f"\nSaved baseline to {args.baseline}")
+        return EXIT_OK
+
+    try:
+        with open(args.baseline, "r") as file:
+            baseline = json.load(file)
+    except FileNotFoundError:
+        print(f"\nNo baseline at {args.baseline}, run with --save-baseline to create one")
+        return EXIT_NO_BASELINE
+
+    regressions, missing = compare(results, baseline, args.tolerance)
+    if missing:
+        print("\nNO BASELINE:")
+        for name, phase in missing:
+            print(f"  {name} {phase}: no baseline")
+
+    if not regressions:
+        print(f"\nNo regressions beyond {args.tolerance:.0%} of {args.baseline}")
+        return EXIT_OK
+
+    print("\nREGRESSIONS:")
+    for name, phase, base, value in regressions:
+        print(f"  {name} {phase}: {base:.1f}us -> {value:.1f}us (+{value / base - 1:.0%})")
+    return EXIT_REGRESSION
+
+if __name__ == "__main__":
+    sys.exit(main_benchmark())
@@ -3,6 +3,10 @@ import random
 import sys
 import os
 
+from snapshot import SNAPSHOT_FILE, GameState, SnapshotError, delete_snapshot, read_snapshot, write_snapshot
+from telemetry import Telemetry
+from waves import WaveConfigError, default_wave_schedule, load_wave_schedule
+
 # Initialize Pygame
 pygame.init()
 
@@ -25,6 +29,11 @@ LIGHT_GRAY = (200, 200, 200)
 EXPLOSION_DURATION = 30  # Frames the explosion lasts (0.5 seconds at 60 FPS)
 EXPLOSION_SIZE = 60
 
+# Instructions page settings
+INSTRUCTIONS_TOP = 165  # Top of the scrolling text area
+INSTRUCTIONS_LINE_HEIGHT = 30
+SCROLL_FRICTION = 0.85  # Fraction of scroll velocity kept each frame
+
 # Game states
 MENU_STATE = "menu"
 INSTRUCTIONS_STATE = "instructions"
@@ -59,6 +68,60 @@ POWERUP_POINTS = 3
 POINTS_PER_LEVEL = 10  # Points needed to increase level
 MAX_ASTEROID_SPEED = 8
 MAX_SPAWN_RATE = 0.08
+BOSS_WARNING_DURATION = 120  # Frames the boss wave warning is shown
+
+# Snapshot settings
+AUTOSAVE_INTERVAL = 5 * FPS  # Frames between autosaves while playing
+
+# Telemetry settings
+FRAME_SPIKE_MS = 2 * 1000 // FPS  # Frames slower than two frame budgets are logged
+
+# Instructions page text
+INSTRUCTIONS = [
+    "CONTROLS:",
+    "A/D or Arrow Keys - Move ship left/right",
+    "Spacebar - Shoot bullet (costs 1 point)",
+    "ESC - Pause/Resume game",
+    "R - Restart game (when game over)",
+    "",
+    "GAMEPLAY:",
+    "• Destroy asteroids to earn points",
+    "• Each asteroid destroyed = +2 points",
+    "• Bullet cost is refunded if you hit an asteroid",
+    "• Every 10 points = Level up!",
+    "",
+    "LEVEL PROGRESSION:",
+    "• Ship gets bigger each level",
+    "• Asteroids move faster",
+    "• More asteroids spawn",
+    "• Maximum ship size: 80x80 pixels",
+    "",
+    "OBJECTIVE:",
+    "Survive as long as possible and",
+    "reach the highest level!",
+    "",
+    "TIPS:",
+    "• Start with small movements to get used to controls",
+    "• Save your shots for when you're sure you'll hit",
+    "• The bigger your ship gets, the easier it is to hit asteroids",
+    "• Don't panic when asteroids get faster - focus on accuracy",
+    "• Try to reach higher levels for better high scores!",
+    "• Accurate shots are rewarded - missed shots cost points"
+]
+INSTRUCTIONS_HEADINGS = ["CONTROLS:", "GAMEPLAY:", "LEVEL PROGRESSION:", "OBJECTIVE:", "TIPS:"]
+
+# Scaled images shared by every sprite of the same kind
+image_cache = {}
+
+def load_image(filename, width, height):
+    key = (filename, width, height)
+    if key not in image_cache:
+        try:
+            image = pygame.image.load(os.path.join("res", filename))
+            image_cache[key] = pygame.transform.scale(image, (width, height))
+        except:
+            image_cache[key] = None
+    return image_cache[key]
 
 class Button:
     def __init__(self, x, y, width, height, text, color, hover_color):
@@ -66,23 +129,31 @@ class Button:
         self.text = text
         self.color = color
         self.hover_color = hover_color
-        self.current_color = color
+        self.hovered = False
         self.font = pygame.font.Font(None, 36)
+        
+        # Both looks are rendered once and reused every frame
+        self.surfaces = {
+            False: self.render(color),
+            True: self.render(hover_color),
+        }
     
-    def draw(self, screen):
-        pygame.draw.rect(screen, self.current_color, self.rect)
-        pygame.draw.rect(screen, WHITE, self.rect, 2)
+    def render(self, color):
+        surface = pygame.Surface(self.rect.size)
+        surface.fill(color)
+        pygame.draw.rect(surface, WHITE, surface.get_rect(), 2)
         
         text_surface = self.font.render(self.text, True, BLACK)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+        text_rect = text_surface.get_rect(center=surface.get_rect().center)
+        surface.blit(text_surface, text_rect)
+        return surface
+    
+    def draw(self, screen):
+        screen.blit(self.surfaces[self.hovered], self.rect)
     
     def handle_event(self, event):
         if event.type == pygame.MOUSEMOTION:
-            if self.rect.collidepoint(event.pos):
-                self.current_color = self.hover_color
-            else:
-                self.current_color = self.color
+            self.hovered = self.rect.collidepoint(event.pos)
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if self.rect.collidepoint(event.pos):
                 return True
@@ -99,11 +170,7 @@ class Explosion:
         self.rect = pygame.Rect(x, y, self.width, self.height)
         
         # Load explosion image
-        try:
-            self.image = pygame.image.load(os.path.join("res", "explosion.png"))
-            self.image = pygame.transform.scale(self.image, (self.width, self.height))
-        except:
-            self.image = None
+        self.image = load_image("explosion.png", self.width, self.height)
     
     def update(self):
         self.current_frame += 1
@@ -126,11 +193,7 @@ class Powerup:
         self.rect = pygame.Rect(x, y, self.width, self.height)
         
         # Load powerup image
-        try:
-            self.image = pygame.image.load(os.path.join("res", "powerup1.png"))
-            self.image = pygame.transform.scale(self.image, (self.width, self.height))
-        except:
-            self.image = None
+        self.image = load_image("powerup1.png", self.width, self.height)
     
     def move(self):
         self.y += self.speed
@@ -211,8 +274,11 @@ class Bullet:
     def is_off_screen(self):
         return self.y < -self.height
 
+# Asteroid images, indexed by Asteroid.image_index
+ASTEROID_IMAGES = ["Asteroid1.png", "Asteroid2.png", "Asteroid3.png", "Asteroid4.png"]
+
 class Asteroid:
-    def __init__(self, x, y, speed=None):
+    def __init__(self, x, y, speed=None, image_index=None):
         self.x = x
         self.y = y
         self.width = ASTEROID_WIDTH
@@ -221,13 +287,10 @@ class Asteroid:
         self.rect = pygame.Rect(x, y, self.width, self.height)
         
         # Load asteroid image (randomly choose from available asteroid images)
-        asteroid_images = ["Asteroid1.png", "Asteroid2.png", "Asteroid3.png", "Asteroid4.png"]
-        try:
-            asteroid_image = random.choice(asteroid_images)
-            self.image = pygame.image.load(os.path.join("res", asteroid_image))
-            self.image = pygame.transform.scale(self.image, (self.width, self.height))
-        except:
-            self.image = None
+        if image_index is None:
+            image_index = random.randrange(len(ASTEROID_IMAGES))
+        self.image_index = image_index
+        self.image = load_image(ASTEROID_IMAGES[image_index], self.width, self.height)
     
     def move(self):
         self.y += self.speed
@@ -243,7 +306,7 @@ class Asteroid:
         return self.y > SCREEN_HEIGHT
 
 class Game:
-    def __init__(self):
+    def __init__(self, telemetry=None):
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Asteroid Shooter")
         self.clock = pygame.time.Clock()
@@ -262,10 +325,18 @@ class Game:
         self.quit_button = Button(button_x, 390, button_width, button_height, "Quit", RED, LIGHT_GRAY)
         self.back_button = Button(50, 50, 100, 40, "Back", GRAY, LIGHT_GRAY)
         self.menu_button = Button(button_x, 320, button_width, button_height, "Main Menu", BLUE, LIGHT_GRAY)
+        self.resume_button = Button(button_x, 460, button_width, button_height, "Resume Game", YELLOW, LIGHT_GRAY)
         
         # Instructions scrolling
         self.instructions_scroll_y = 0
-        self.instructions_scroll_speed = 30
+        self.instructions_scroll_velocity = 0
+        self.instructions_scroll_speed = 30  # Pixels per wheel notch or key press
+        
+        # Pre-rendered screens, built on first use
+        self.instructions_surface = None
+        self.instructions_header = None
+        self.menu_surface = None
+        self.menu_cache_key = None
         
         # Game objects
         self.player = Player(SCREEN_WIDTH // 2 - PLAYER_WIDTH // 2, 
@@ -286,14 +357,24 @@ class Game:
         self.small_font = pygame.font.Font(None, 36)
         self.score_font = pygame.font.Font(None, 48)
         
+        # Session event log, written to disk by a background thread
+        self.telemetry = telemetry if telemetry is not None else Telemetry()
+        
         # High scores
         self.high_score, self.high_level = self.load_high_scores()
         
+        # Level definitions, compiled once into a lookup table
+        self.waves = self.load_waves()
+        
         # Difficulty progression
-        self.current_asteroid_speed = ASTEROID_SPEED
-        self.current_spawn_rate = ASTEROID_SPAWN_RATE
         self.difficulty_level = 1
-        self.points_for_next_level = POINTS_PER_LEVEL
+        self.apply_level()
+        self.points_for_next_level = self.waves.points_per_level
+        self.boss_warning_timer = 0
+        
+        # Saved run to resume from the menu
+        self.has_snapshot = os.path.exists(SNAPSHOT_FILE)
+        self.frames_since_save = 0
         
         # Load background image
         try:
@@ -321,28 +402,47 @@ class Game:
             self.current_state = INSTRUCTIONS_STATE
         elif self.quit_button.handle_event(event):
             self.running = False
+        elif self.has_snapshot and self.resume_button.handle_event(event):
+            self.resume_game()
     
     def handle_instructions_events(self, event):
         if self.back_button.handle_event(event):
             self.current_state = MENU_STATE
             self.instructions_scroll_y = 0  # Reset scroll when leaving
+            self.instructions_scroll_velocity = 0
+        
+        # Each notch or key press adds velocity that decays to roughly one scroll step
+        impulse = self.instructions_scroll_speed * (1 - SCROLL_FRICTION)
         
-        # Handle scrolling with mouse wheel
+        # Handle scrolling with mouse wheel (wheel up scrolls toward the top, like the UP arrow)
         if event.type == pygame.MOUSEWHEEL:
-            self.instructions_scroll_y -= event.y * self.instructions_scroll_speed
-            # Prevent scrolling too far up
-            self.instructions_scroll_y = max(self.instructions_scroll_y, -400)
-            # Prevent scrolling too far down
-            self.instructions_scroll_y = min(self.instructions_scroll_y, 0)
+            self.instructions_scroll_velocity += event.y * impulse
         
         # Handle keyboard scrolling
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_UP:
-                self.instructions_scroll_y += self.instructions_scroll_speed
-                self.instructions_scroll_y = min(self.instructions_scroll_y, 0)
+                self.instructions_scroll_velocity += impulse
             elif event.key == pygame.K_DOWN:
-                self.instructions_scroll_y -= self.instructions_scroll_speed
-                self.instructions_scroll_y = max(self.instructions_scroll_y, -400)
+                self.instructions_scroll_velocity -= impulse
+    
+    def update_instructions_scroll(self):
+        if self.instructions_scroll_velocity == 0:
+            return
+        
+        self.instructions_scroll_y += self.instructions_scroll_velocity
+        self.instructions_scroll_velocity *= SCROLL_FRICTION
+        if abs(self.instructions_scroll_velocity) < 0.1:
+            self.instructions_scroll_velocity = 0
+        
+        # Stop at either end of the real content
+        max_scroll = self.instructions_max_scroll()
+        if self.instructions_scroll_y > 0 or self.instructions_scroll_y < -max_scroll:
+            self.instructions_scroll_y = min(0, max(self.instructions_scroll_y, -max_scroll))
+            self.instructions_scroll_velocity = 0
+    
+    def instructions_max_scroll(self):
+        content_height = self.get_instructions_surface().get_height()
+        return max(0, content_height - (SCREEN_HEIGHT - INSTRUCTIONS_TOP))
     
     def handle_game_events(self, event):
         if event.type == pygame.KEYDOWN:
@@ -358,9 +458,12 @@ class Game:
                     new_bullet.cost_paid = False  # Track if we've already paid for this bullet
                     self.bullets.append(new_bullet)
                     self.score -= 1
+                    self.telemetry.log("shot", level=self.difficulty_level, score=self.score)
                     if self.score <= 0:
                         self.game_over = True
+                        self.telemetry.log("game_over", cause="score", score=self.score, level=self.difficulty_level)
                         self.check_and_save_high_scores()
+                        self.discard_snapshot()
             elif event.key == pygame.K_r and self.game_over:
                 # Restart game
                 self.restart_game()
@@ -370,10 +473,19 @@ class Game:
                 self.return_to_menu()
     
     def start_game(self):
+        self.discard_snapshot()
         self.current_state = GAME_STATE
         self.restart_game()
     
+    def resume_game(self):
+        if self.load_snapshot():
+            self.current_state = GAME_STATE
+    
     def return_to_menu(self):
+        if not self.game_over:
+            self.telemetry.log("run_end", score=self.score, level=self.difficulty_level)
+            # Keep the run so it can be resumed from the menu
+            self.save_snapshot()
         self.current_state = MENU_STATE
         self.paused = False
         self.restart_game()
@@ -392,11 +504,20 @@ class Game:
                 bullet.move()
                 if bullet.is_off_screen():
                     self.bullets.remove(bullet)
+                    self.telemetry.log("miss", level=self.difficulty_level)
             
             # Spawn asteroids
             if random.random() < self.current_spawn_rate:
-                asteroid_x = random.randint(0, SCREEN_WIDTH - ASTEROID_WIDTH)
-                self.asteroids.append(Asteroid(asteroid_x, -ASTEROID_HEIGHT, self.current_asteroid_speed))
+                for _ in range(self.current_spawn_count):
+                    asteroid_x = random.randint(0, SCREEN_WIDTH - ASTEROID_WIDTH)
+                    self.asteroids.append(Asteroid(asteroid_x, -ASTEROID_HEIGHT, self.current_asteroid_speed))
+            
+            # Spawn scripted waves for this level
+            for event in self.waves.events_at(self.difficulty_level, self.level_frame):
+                self.spawn_wave(event)
+            self.level_frame += 1
+            if self.boss_warning_timer > 0:
+                self.boss_warning_timer -= 1
             
             # Update asteroids
             for asteroid in self.asteroids[:]:
@@ -417,6 +538,13 @@ class Game:
             
             # Collision detection
             self.check_collisions()
+            
+            # Autosave so the run survives a crash
+            self.frames_since_save += 1
+            if self.frames_since_save >= AUTOSAVE_INTERVAL and not self.game_over:
+                self.save_snapshot()
+        elif self.current_state == INSTRUCTIONS_STATE:
+            self.update_instructions_scroll()
     
     def check_collisions(self):
         # Check bullet-asteroid collisions
@@ -425,6 +553,7 @@ class Game:
                 if bullet.rect.colliderect(asteroid.rect):
                     if bullet in self.bullets:
                         self.bullets.remove(bullet)
+                        self.telemetry.log("hit", level=self.difficulty_level)
                         # Refund the bullet cost if it hit an asteroid
                         if not bullet.cost_paid:
                             self.score += 1
@@ -442,11 +571,14 @@ class Game:
             if self.player.rect.colliderect(asteroid.rect):
                 self.lives -= 1
                 self.asteroids.remove(asteroid)
+                self.telemetry.log("life_lost", lives=self.lives, level=self.difficulty_level)
                 if self.lives <= 0:
                     self.game_over = True
+                    self.telemetry.log("game_over", cause="lives", score=self.score, level=self.difficulty_level)
                     # Create explosion at player position
                     self.game_over_explosion = Explosion(self.player.x, self.player.y)
                     self.check_and_save_high_scores()
+                    self.discard_snapshot()
         
         # Check player-powerup collisions
         for powerup in self.powerups[:]:
@@ -455,11 +587,9 @@ class Game:
                 self.powerups.remove(powerup)
     
     def draw(self):
-        # Draw background
-        if self.background:
-            self.screen.blit(self.background, (0, 0))
-        else:
-            self.screen.fill(BLACK)
+        # Draw background (the cached menu screen already includes it)
+        if self.current_state != MENU_STATE:
+            self.draw_background(self.screen)
         
         if self.current_state == MENU_STATE:
             self.draw_menu()
@@ -470,79 +600,78 @@ class Game:
         
         pygame.display.flip()
     
-    def draw_menu(self):
-        # Draw title
-        title_text = self.font.render("ASTEROID SHOOTER", True, WHITE)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 150))
-        self.screen.blit(title_text, title_rect)
-        
-        # Draw buttons
-        self.start_button.draw(self.screen)
-        self.instructions_button.draw(self.screen)
-        self.quit_button.draw(self.screen)
+    def draw_background(self, surface):
+        if self.background:
+            surface.blit(self.background, (0, 0))
+        else:
+            surface.fill(BLACK)
     
-    def draw_instructions(self):
-        # Draw title
-        title_text = self.font.render("INSTRUCTIONS", True, WHITE)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 100))
-        self.screen.blit(title_text, title_rect)
-        
-        # Draw back button
-        self.back_button.draw(self.screen)
-        
-        # Draw scroll instructions
-        scroll_text = self.small_font.render("Use mouse wheel or UP/DOWN arrows to scroll", True, GRAY)
-        scroll_rect = scroll_text.get_rect(center=(SCREEN_WIDTH // 2, 140))
-        self.screen.blit(scroll_text, scroll_rect)
-        
-        # Instructions text
-        instructions = [
-            "CONTROLS:",
-            "A/D or Arrow Keys - Move ship left/right",
-            "Spacebar - Shoot bullet (costs 1 point)",
-            "ESC - Pause/Resume game",
-            "R - Restart game (when game over)",
-            "",
-            "GAMEPLAY:",
-            "• Destroy asteroids to earn points",
-            "• Each asteroid destroyed = +2 points",
-            "• Bullet cost is refunded if you hit an asteroid",
-            "• Every 10 points = Level up!",
-            "",
-            "LEVEL PROGRESSION:",
-            "• Ship gets bigger each level",
-            "• Asteroids move faster",
-            "• More asteroids spawn",
-            "• Maximum ship size: 80x80 pixels",
-            "",
-            "OBJECTIVE:",
-            "Survive as long as possible and",
-            "reach the highest level!",
-            "",
-            "TIPS:",
-            "• Start with small movements to get used to controls",
-            "• Save your shots for when you're sure you'll hit",
-            "• The bigger your ship gets, the easier it is to hit asteroids",
-            "• Don't panic when asteroids get faster - focus on accuracy",
-            "• Try to reach higher levels for better high scores!",
-            "• Accurate shots are rewarded - missed shots cost points"
-        ]
-        
-        y_offset = 180 + self.instructions_scroll_y
-        for line in instructions:
-            # Only draw text that's visible on screen
-            if y_offset > -30 and y_offset < SCREEN_HEIGHT + 30:
+    def draw_menu(self):
+        # Rebuild the cached menu only when a button's hover state changes
+        buttons = [self.start_button, self.instructions_button, self.quit_button]
+        if self.has_snapshot:
+            buttons.append(self.resume_button)
+        cache_key = tuple(button.hovered for button in buttons)
+        
+        if self.menu_surface is None or cache_key != self.menu_cache_key:
+            self.menu_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+            self.draw_background(self.menu_surface)
+            
+            # Draw title
+            title_text = self.font.render("ASTEROID SHOOTER", True, WHITE)
+            title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 150))
+            self.menu_surface.blit(title_text, title_rect)
+            
+            # Draw buttons
+            for button in buttons:
+                button.draw(self.menu_surface)
+            self.menu_cache_key = cache_key
+        
+        self.screen.blit(self.menu_surface, (0, 0))
+    
+    def get_instructions_surface(self):
+        # Render every line once into one tall transparent surface
+        if self.instructions_surface is None:
+            height = len(INSTRUCTIONS) * INSTRUCTIONS_LINE_HEIGHT
+            self.instructions_surface = pygame.Surface((SCREEN_WIDTH, height), pygame.SRCALPHA).convert_alpha()
+            
+            y_offset = INSTRUCTIONS_LINE_HEIGHT // 2
+            for line in INSTRUCTIONS:
                 if line.startswith("•"):
                     color = GREEN
-                elif line in ["CONTROLS:", "GAMEPLAY:", "LEVEL PROGRESSION:", "OBJECTIVE:", "TIPS:"]:
+                elif line in INSTRUCTIONS_HEADINGS:
                     color = YELLOW
                 else:
                     color = WHITE
                 
                 text_surface = self.small_font.render(line, True, color)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
-                self.screen.blit(text_surface, text_rect)
-            y_offset += 30
+                self.instructions_surface.blit(text_surface, text_rect)
+                y_offset += INSTRUCTIONS_LINE_HEIGHT
+        return self.instructions_surface
+    
+    def draw_instructions(self):
+        if self.instructions_header is None:
+            self.instructions_header = pygame.Surface((SCREEN_WIDTH, INSTRUCTIONS_TOP), pygame.SRCALPHA).convert_alpha()
+            
+            # Draw title
+            title_text = self.font.render("INSTRUCTIONS", True, WHITE)
+            title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 100))
+            self.instructions_header.blit(title_text, title_rect)
+            
+            # Draw scroll instructions
+            scroll_text = self.small_font.render("Use mouse wheel or UP/DOWN arrows to scroll", True, GRAY)
+            scroll_rect = scroll_text.get_rect(center=(SCREEN_WIDTH // 2, 140))
+            self.instructions_header.blit(scroll_text, scroll_rect)
+        
+        self.screen.blit(self.instructions_header, (0, 0))
+        
+        # Draw back button
+        self.back_button.draw(self.screen)
+        
+        # Draw only the visible slice of the pre-rendered text
+        visible_area = pygame.Rect(0, round(-self.instructions_scroll_y), SCREEN_WIDTH, SCREEN_HEIGHT - INSTRUCTIONS_TOP)
+        self.screen.blit(self.get_instructions_surface(), (0, INSTRUCTIONS_TOP), visible_area)
     
     def draw_game(self):
         # Draw game objects
@@ -571,6 +700,10 @@ class Game:
         self.draw_lives()
         self.draw_difficulty()
         
+        # Draw boss wave warning
+        if self.boss_warning_timer > 0 and not self.game_over:
+            self.draw_boss_warning()
+        
         # Draw pause screen
         if self.paused:
             self.draw_pause_screen()
@@ -579,6 +712,11 @@ class Game:
         if self.game_over:
             self.draw_game_over()
     
+    def draw_boss_warning(self):
+        warning_text = self.score_font.render("BOSS WAVE!", True, RED)
+        warning_rect = warning_text.get_rect(center=(SCREEN_WIDTH // 2, 40))
+        self.screen.blit(warning_text, warning_rect)
+    
     def draw_pause_screen(self):
         # Create a semi-transparent overlay
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -606,46 +744,40 @@ class Game:
                 if len(lines) >= 2:
                     high_score = int(lines[0].strip())
                     high_level = int(lines[1].strip())
-                    print(f"Loaded high scores: Score={high_score}, Level={high_level}")
+                    self.telemetry.log("highscores_loaded", score=high_score, level=high_level)
                     return high_score, high_level
                 else:
-                    print("Not enough lines in highscores.txt, using defaults")
+                    self.telemetry.log("highscores_default", reason="too few lines")
                     return 0, 1
         except FileNotFoundError:
-            print("highscores.txt not found, using defaults")
+            self.telemetry.log("highscores_default", reason="not found")
             return 0, 1
         except Exception as e:
-            print(f"Error loading high scores: {e}")
+            self.telemetry.log("highscores_default", reason=str(e))
             return 0, 1
     
     def save_high_scores(self, score, level):
         try:
             with open("highscores.txt", "w") as file:
                 file.write(f"{score}\n{level}")
-            print(f"Saved high scores: Score={score}, Level={level}")
+            self.telemetry.log("highscores_saved", score=score, level=level)
         except Exception as e:
-            print(f"Error saving high scores: {e}")
-            pass  # Silently fail if can't save
+            self.telemetry.log("highscores_save_failed", reason=str(e))
     
     def check_and_save_high_scores(self):
-        print(f"Checking high scores - Current: Score={self.score}, Level={self.difficulty_level}")
-        print(f"Current highs - Score={self.high_score}, Level={self.high_level}")
-        
         # Check if current score is higher than high score
         if self.score > self.high_score:
-            print(f"New high score! {self.score} > {self.high_score}")
+            self.telemetry.log("record", kind="score", old=self.high_score, new=self.score)
             self.high_score = self.score
             self.save_high_scores(self.score, self.difficulty_level)
         elif self.score == self.high_score and self.difficulty_level > self.high_level:
-            print(f"Same score but higher level! Level {self.difficulty_level} > {self.high_level}")
+            self.telemetry.log("record", kind="level", old=self.high_level, new=self.difficulty_level)
             self.high_level = self.difficulty_level
             self.save_high_scores(self.score, self.difficulty_level)
         elif self.difficulty_level > self.high_level:
-            print(f"Higher level reached! Level {self.difficulty_level} > {self.high_level}")
+            self.telemetry.log("record", kind="level", old=self.high_level, new=self.difficulty_level)
             self.high_level = self.difficulty_level
             self.save_high_scores(self.high_score, self.difficulty_level)
-        else:
-            print("No new records")
     
     def draw_high_scores(self):
         # Draw current score and level
@@ -672,14 +804,10 @@ class Game:
         # Increase difficulty based on points
         if self.score >= self.points_for_next_level:
             self.difficulty_level += 1
+            self.telemetry.log("level_up", level=self.difficulty_level, score=self.score)
             
-            # Increase asteroid speed (capped at MAX_ASTEROID_SPEED)
-            speed_increase = min(0.5, (MAX_ASTEROID_SPEED - self.current_asteroid_speed) / 10)
-            self.current_asteroid_speed = min(MAX_ASTEROID_SPEED, self.current_asteroid_speed + speed_increase)
-            
-            # Increase spawn rate (capped at MAX_SPAWN_RATE)
-            spawn_increase = min(0.005, (MAX_SPAWN_RATE - self.current_spawn_rate) / 10)
-            self.current_spawn_rate = min(MAX_SPAWN_RATE, self.current_spawn_rate + spawn_increase)
+            # Switch asteroid speed, spawn rate and pattern to the new level's definition
+            self.apply_level()
             
             # Increase ship size (capped at MAX_PLAYER_WIDTH/HEIGHT)
             new_width = min(MAX_PLAYER_WIDTH, PLAYER_WIDTH + (self.difficulty_level - 1) * PLAYER_SIZE_INCREASE)
@@ -687,11 +815,121 @@ class Game:
             self.player.resize(new_width, new_height)
             
             # Update points needed for next level
-            self.points_for_next_level += POINTS_PER_LEVEL
+            self.points_for_next_level += self.waves.points_per_level
             
-            # Spawn powerup after level up
-            powerup_x = random.randint(0, SCREEN_WIDTH - POWERUP_WIDTH)
-            self.powerups.append(Powerup(powerup_x, -POWERUP_HEIGHT))
+            # Spawn powerups after level up
+            for _ in range(self.current_powerup_drops):
+                powerup_x = random.randint(0, SCREEN_WIDTH - POWERUP_WIDTH)
+                self.powerups.append(Powerup(powerup_x, -POWERUP_HEIGHT))
+    
+    def load_waves(self):
+        try:
+            return load_wave_schedule(POINTS_PER_LEVEL)
+        except FileNotFoundError:
+            self.telemetry.log("levels_default", reason="not found")
+        except (OSError, WaveConfigError) as e:
+            self.telemetry.log("levels_default", reason=str(e))
+        return default_wave_schedule(ASTEROID_SPEED, ASTEROID_SPAWN_RATE, MAX_ASTEROID_SPEED,
+                                     MAX_SPAWN_RATE, POINTS_PER_LEVEL)
+    
+    def apply_level(self):
+        level = self.waves.level(self.difficulty_level)
+        self.current_asteroid_speed = level.asteroid_speed
+        self.current_spawn_rate = level.spawn_rate
+        self.current_spawn_count = level.spawn_count
+        self.current_powerup_drops = level.powerup_drops
+        self.level_frame = 0
+    
+    def spawn_wave(self, event):
+        if event.formation == "wall":
+            # A row of asteroids across the screen with a random gap to fly through
+            slots = SCREEN_WIDTH // ASTEROID_WIDTH
+            count = min(event.count, slots)
+            first_slot = (slots - count) // 2
+            gap = min(event.gap, count)
+            gap_start = random.randint(0, count - gap)
+            for slot in range(count):
+                if gap_start <= slot < gap_start + gap:
+                    continue
+                asteroid_x = (first_slot + slot) * ASTEROID_WIDTH
+                self.asteroids.append(Asteroid(asteroid_x, -ASTEROID_HEIGHT, event.speed))
+        elif event.formation == "column":
+            # A stack of asteroids falling in a single lane
+            asteroid_x = random.randint(0, SCREEN_WIDTH - ASTEROID_WIDTH)
+            for i in range(event.count):
+                self.asteroids.append(Asteroid(asteroid_x, -ASTEROID_HEIGHT * (i * 2 + 1), event.speed))
+        
+        if event.boss:
+            self.boss_warning_timer = BOSS_WARNING_DURATION
+    
+    def save_snapshot(self):
+        state = GameState(
+            self.score, self.lives, self.difficulty_level, self.points_for_next_level,
+            self.current_asteroid_speed, self.current_spawn_rate, self.level_frame, self.boss_warning_timer,
+            self.player.x, self.player.y, self.player.width, self.player.height,
+            [(bullet.x, bullet.y, bullet.cost_paid) for bullet in self.bullets],
+            [(asteroid.x, asteroid.y, asteroid.speed, asteroid.image_index) for asteroid in self.asteroids],
+            [(powerup.x, powerup.y) for powerup in self.powerups],
+            [(explosion.x, explosion.y, explosion.current_frame) for explosion in self.explosions],
+        )
+        self.frames_since_save = 0
+        try:
+            write_snapshot(state)
+            self.has_snapshot = True
+        except (OSError, SnapshotError) as e:
+            self.telemetry.log("snapshot_save_failed", reason=str(e))
+    
+    def load_snapshot(self):
+        try:
+            state = read_snapshot()
+        except (OSError, SnapshotError) as e:
+            self.telemetry.log("snapshot_load_failed", reason=str(e))
+            self.discard_snapshot()
+            return False
+        
+        self.game_over = False
+        self.paused = True  # Give the player a moment before the action resumes
+        self.game_over_explosion = None
+        self.score = state.score
+        self.lives = state.lives
+        
+        # Restore difficulty, then the exact values saved mid-level
+        self.difficulty_level = state.difficulty_level
+        self.apply_level()
+        self.points_for_next_level = state.points_for_next_level
+        self.current_asteroid_speed = state.asteroid_speed
+        self.current_spawn_rate = state.spawn_rate
+        self.level_frame = state.level_frame
+        self.boss_warning_timer = state.boss_warning_timer
+        
+        self.player.x = state.player_x
+        self.player.y = state.player_y
+        self.player.resize(state.player_width, state.player_height)
+        
+        self.bullets = []
+        for x, y, cost_paid in state.bullets:
+            bullet = Bullet(x, y)
+            bullet.cost_paid = cost_paid
+            self.bullets.append(bullet)
+        self.asteroids = [Asteroid(x, y, speed, image_index % len(ASTEROID_IMAGES))
+                          for x, y, speed, image_index in state.asteroids]
+        self.powerups = [Powerup(x, y) for x, y in state.powerups]
+        self.explosions = []
+        for x, y, current_frame in state.explosions:
+            explosion = Explosion(x, y)
+            explosion.current_frame = current_frame
+            self.explosions.append(explosion)
+        
+        self.frames_since_save = 0
+        self.telemetry.log("run_resume", score=self.score, level=self.difficulty_level)
+        return True
+    
+    def discard_snapshot(self):
+        try:
+            delete_snapshot()
+        except OSError as e:
+            self.telemetry.log("snapshot_delete_failed", reason=str(e))
+        self.has_snapshot = False
     
     def draw_score(self):
         score_text = self.score_font.render(f"Score: {self.score}", True, WHITE)
@@ -740,13 +978,17 @@ class Game:
         self.game_over_explosion = None
         
         # Reset difficulty
-        self.current_asteroid_speed = ASTEROID_SPEED
-        self.current_spawn_rate = ASTEROID_SPAWN_RATE
         self.difficulty_level = 1
-        self.points_for_next_level = POINTS_PER_LEVEL
+        self.apply_level()
+        self.points_for_next_level = self.waves.points_per_level
+        self.boss_warning_timer = 0
+        self.frames_since_save = 0
         
         # Reload high scores
         self.high_score, self.high_level = self.load_high_scores()
+        
+        if self.current_state == GAME_STATE:
+            self.telemetry.log("run_start")
     
     def run(self):
         while self.running:
@@ -758,8 +1000,16 @@ class Game:
             self.fps_counter = int(self.clock.get_fps())
             pygame.display.set_caption(f"Asteroid Shooter - FPS: {self.fps_counter}")
             
-            self.clock.tick(FPS)
+            frame_ms = self.clock.tick(FPS)
+            if frame_ms > FRAME_SPIKE_MS:
+                self.telemetry.log("frame_spike", ms=frame_ms, state=self.current_state)
+        
+        # Save an unfinished run so it can be resumed next time
+        if self.current_state == GAME_STATE and not self.game_over:
+            self.telemetry.log("run_end", score=self.score, level=self.difficulty_level)
+            self.save_snapshot()
         
+        self.telemetry.close()
         pygame.quit()
         sys.exit()
 
@@ -0,0 +1,85 @@
+import os
+import struct
+from collections import namedtuple
+
+# Snapshot file settings
+SNAPSHOT_FILE = "savegame.bin"
+SNAPSHOT_MAGIC = b"ASTS"
+SNAPSHOT_VERSION = 1
+
+# Fixed-size records, little endian. Positions are float32, which is exact for every on-screen pixel.
+HEADER = struct.Struct("<4sH")
+STATE = struct.Struct("<iiiiddiiiiiiIIII")
+BULLET = struct.Struct("<ff?")
+ASTEROID = struct.Struct("<fffB")
+POWERUP = struct.Struct("<ff")
+EXPLOSION = struct.Struct("<ffH")
+
+GameState = namedtuple("GameState", [
+    "score", "lives", "difficulty_level", "points_for_next_level",
+    "asteroid_speed", "spawn_rate", "level_frame", "boss_warning_timer",
+    "player_x", "player_y", "player_width", "player_height",
+    "bullets", "asteroids", "powerups", "explosions",
+])
+
+class SnapshotError(ValueError):
+    pass
+
+def pack_state(state):
+    try:
+        return _pack_state(state)
+    except struct.error as e:
+        raise SnapshotError(f"cannot pack snapshot: {e}") from e
+
+def _pack_state(state):
+    # Entity lists hold plain tuples matching the record layouts above
+    parts = [
+        HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION),
+        STATE.pack(*state[:12], len(state.bullets), len(state.asteroids),
+                   len(state.powerups), len(state.explosions)),
+    ]
+    for record, entities in ((BULLET, state.bullets), (ASTEROID, state.asteroids),
+                             (POWERUP, state.powerups), (EXPLOSION, state.explosions)):
+        buffer = bytearray(record.size * len(entities))
+        for i, entity in enumerate(entities):
+            record.pack_into(buffer, i * record.size, *entity)
+        parts.append(buffer)
+    return b"".join(parts)
+
+def unpack_state(data):
+    if len(data) < HEADER.size + STATE.size:
+        raise SnapshotError("snapshot is truncated")
+    magic, version = HEADER.unpack_from(data)
+    if magic != SNAPSHOT_MAGIC:
+        raise SnapshotError("not a snapshot file")
+    if version != SNAPSHOT_VERSION:
+        raise SnapshotError(f"unsupported snapshot version {version}")
+
+    fields = STATE.unpack_from(data, HEADER.size)
+    offset = HEADER.size + STATE.size
+    lists = []
+    for record, count in zip((BULLET, ASTEROID, POWERUP, EXPLOSION), fields[12:]):
+        end = offset + record.size * count
+        if end > len(data):
+            raise SnapshotError("snapshot is truncated")
+        lists.append(list(record.iter_unpack(data[offset:end])))
+        offset = end
+    return GameState(*fields[:12], *lists)
+
+def write_snapshot(state, path=SNAPSHOT_FILE):
+    # Write to a temporary file first so a crash mid-save never corrupts the last good snapshot
+    data = pack_state(state)
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as file:
+        file.write(data)
+    os.replace(temp_path, path)
+
+def read_snapshot(path=SNAPSHOT_FILE):
+    with open(path, "rb") as file:
+        return unpack_state(file.read())
+
+def delete_snapshot(path=SNAPSHOT_FILE):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
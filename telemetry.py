@@ -0,0 +1,121 @@
+import gzip
+import json
+import os
+import threading
+import time
+import uuid
+from collections import deque
+
+# Telemetry settings
+TELEMETRY_DIR = "telemetry"
+TELEMETRY_BUFFER_SIZE = 4096  # Events kept in memory before the oldest are dropped
+TELEMETRY_FLUSH_INTERVAL = 2.0  # Seconds between background flushes
+TELEMETRY_MAX_FILE_BYTES = 256 * 1024  # Rotate to a new file past this compressed size
+TELEMETRY_MAX_FILES = 20  # Oldest files are deleted past this count
+
+class Telemetry:
+    def __init__(self, directory=TELEMETRY_DIR, buffer_size=TELEMETRY_BUFFER_SIZE,
+                 flush_interval=TELEMETRY_FLUSH_INTERVAL, max_file_bytes=TELEMETRY_MAX_FILE_BYTES,
+                 max_files=TELEMETRY_MAX_FILES, enabled=True):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self.max_file_bytes = max_file_bytes
+        self.max_files = max_files
+        self.enabled = enabled
+        self.session = uuid.uuid4().hex[:12]
+        self.start_time = time.monotonic()
+        self.dropped = 0  # Only the game thread writes this
+        self.reported_dropped = 0  # Only the writer thread writes this
+        self.file_index = 0
+        self.file_path = None
+
+        # deque append/popleft are thread-safe, so the game thread never takes a lock
+        self.buffer = deque(maxlen=buffer_size)
+        self.stop_event = threading.Event()
+        self.thread = None
+        if self.enabled:
+            self.thread = threading.Thread(target=self.writer_loop, name="telemetry-writer", daemon=True)
+            self.thread.start()
+
+    def log(self, event, **fields):
+        if not self.enabled:
+            return
+        if len(self.buffer) == self.buffer.maxlen:
+            self.dropped += 1
+        fields["e"] = event
+        fields["t"] = round(time.monotonic() - self.start_time, 3)
+        self.buffer.append(fields)
+
+    def writer_loop(self):
+        while not self.stop_event.wait(self.flush_interval):
+            self.flush()
+        self.flush()
+
+    def flush(self):
+        # Drain whatever is buffered right now into one compressed batch
+        batch = []
+        try:
+            while True:
+                batch.append(self.buffer.popleft())
+        except IndexError:
+            pass
+
+        # Record how many events the ring buffer overwrote since the last batch
+        dropped = self.dropped
+        if dropped != self.reported_dropped:
+            batch.append({"e": "dropped", "t": round(time.monotonic() - self.start_time, 3),
+                          "n": dropped - self.reported_dropped})
+            self.reported_dropped = dropped
+        if not batch:
+            return
+
+        lines = []
+        for event in batch:
+            event["s"] = self.session
+            lines.append(json.dumps(event, separators=(",", ":")))
+        data = ("\n".join(lines) + "\n").encode("utf-8")
+
+        try:
+            path = self.current_file()
+            # Each batch is appended as its own gzip member; gzip.open reads them back as one stream
+            with gzip.open(path, "ab") as file:
+                file.write(data)
+        except OSError:
+            pass  # Telemetry must never break the game
+
+    def current_file(self):
+        # Start a new file when the current one is full or was deleted from under us
+        if (self.file_path is None or not os.path.exists(self.file_path)
+                or os.path.getsize(self.file_path) >= self.max_file_bytes):
+            os.makedirs(self.directory, exist_ok=True)
+            self.file_index += 1
+            self.file_path = os.path.join(self.directory, f"{int(time.time())}-{self.session}-{self.file_index:03d}.jsonl.gz")
+            self.remove_old_files()
+        return self.file_path
+
+    def remove_old_files(self):
+        files = sorted(name for name in os.listdir(self.directory) if name.endswith(".jsonl.gz"))
+        for name in files[:max(0, len(files) - self.max_files + 1)]:
+            os.remove(os.path.join(self.directory, name))
+
+    def close(self):
+        if self.thread is not None:
+            self.stop_event.set()
+            self.thread.join()
+            self.thread = None
+
+def read_events(directory=TELEMETRY_DIR):
+    # Yield every logged event from every telemetry file, oldest file first
+    if not os.path.isdir(directory):
+        return
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith(".jsonl.gz"):
+            continue
+        try:
+            with gzip.open(os.path.join(directory, name), "rt", encoding="utf-8") as file:
+                for line in file:
+                    line = line.strip()
+                    if line:
+                        yield json.loads(line)
+        except (OSError, EOFError, ValueError):
+            continue  # Skip files truncated by a crash
@@ -0,0 +1,169 @@
+import json
+from collections import namedtuple
+
+# Level definitions file
+WAVES_FILE = "levels.json"
+
+# Random spawn patterns (asteroids per spawn) and scripted formations
+SPAWN_PATTERNS = {"single": 1, "pair": 2}
+FORMATIONS = ("wall", "column")
+WALL_GAP = 2  # Default number of open slots in a wall
+CURVE_LEVELS = 100  # Levels generated from the curve; by then it is within 0.001 of its caps
+
+# One compiled level: everything the per-frame spawn logic needs
+Level = namedtuple("Level", ["asteroid_speed", "spawn_rate", "spawn_count", "powerup_drops", "events"])
+
+# One scripted wave: spawned when the level's frame counter hits its key in Level.events
+WaveEvent = namedtuple("WaveEvent", ["formation", "count", "gap", "speed", "boss"])
+
+# Keys accepted in the level file, so typos are reported instead of ignored
+FILE_KEYS = ("points_per_level", "curve", "levels")
+CURVE_KEYS = ("asteroid_speed", "spawn_rate")
+GROWTH_KEYS = ("start", "step", "cap")
+LEVEL_KEYS = ("asteroid_speed", "spawn_rate", "pattern", "powerup_drops", "waves")
+WAVE_KEYS = ("frame", "formation", "count", "gap", "speed", "boss")
+
+class WaveConfigError(ValueError):
+    pass
+
+class WaveSchedule:
+    def __init__(self, levels, points_per_level):
+        self.levels = tuple(levels)
+        self.points_per_level = points_per_level
+
+    def level(self, difficulty_level):
+        # Levels past the end of the table keep the last definition
+        return self.levels[min(difficulty_level, len(self.levels)) - 1]
+
+    def events_at(self, difficulty_level, frame):
+        return self.level(difficulty_level).events.get(frame, ())
+
+def _number(entry, key, where, default=None, minimum=0, integer=False):
+    value = entry.get(key, default)
+    if value is None:
+        raise WaveConfigError(f"{where}: missing '{key}'")
+    kind = int if integer else (int, float)
+    if isinstance(value, bool) or not isinstance(value, kind):
+        raise WaveConfigError(f"{where}: '{key}' must be a number, got {value!r}")
+    if value < minimum:
+        raise WaveConfigError(f"{where}: '{key}' must be >= {minimum}, got {value!r}")
+    return value
+
+def _check_keys(entry, allowed, where):
+    if not isinstance(entry, dict):
+        raise WaveConfigError(f"{where}: expected an object")
+    unknown = sorted(set(entry) - set(allowed))
+    if unknown:
+        raise WaveConfigError(f"{where}: unknown key {unknown[0]!r}")
+
+def _choice(entry, key, where, default, choices):
+    value = entry.get(key, default)
+    if not isinstance(value, str) or value not in choices:
+        raise WaveConfigError(f"{where}: unknown {key} {value!r}")
+    return value
+
+def _compile_event(entry, where, level_speed):
+    _check_keys(entry, WAVE_KEYS, where)
+    formation = _choice(entry, "formation", where, "wall", FORMATIONS)
+    frame = _number(entry, "frame", where, integer=True)
+    count = _number(entry, "count", where, integer=True, minimum=1)
+    gap = 0
+    if formation == "wall":
+        # Walls always leave a way through
+        gap = _number(entry, "gap", where, default=WALL_GAP, integer=True, minimum=1)
+        if gap >= count:
+            raise WaveConfigError(f"{where}: 'gap' must be smaller than 'count', got {gap!r} >= {count!r}")
+    speed = _number(entry, "speed", where, default=level_speed, minimum=0.1)
+    boss = entry.get("boss", False)
+    if not isinstance(boss, bool):
+        raise WaveConfigError(f"{where}: 'boss' must be true or false, got {boss!r}")
+    return frame, WaveEvent(formation, count, gap, float(speed), boss)
+
+def _grow(value, growth):
+    # Each level closes a tenth of the distance to the cap, at most one step
+    step, cap = growth
+    return min(cap, value + min(step, (cap - value) / 10))
+
+def _compile_growth(entry, where, minimum, maximum):
+    _check_keys(entry, GROWTH_KEYS, where)
+    start = _number(entry, "start", where, minimum=minimum)
+    step = _number(entry, "step", where)
+    cap = _number(entry, "cap", where, minimum=start)
+    if cap > maximum:
+        raise WaveConfigError(f"{where}: 'cap' must be <= {maximum}, got {cap!r}")
+    return float(start), (float(step), float(cap))
+
+def _compile_curve(entry):
+    _check_keys(entry, CURVE_KEYS, "curve")
+    for key in CURVE_KEYS:
+        if key not in entry:
+            raise WaveConfigError(f"curve: missing '{key}'")
+    speed = _compile_growth(entry["asteroid_speed"], "curve asteroid_speed", 0.1, float("inf"))
+    spawn_rate = _compile_growth(entry["spawn_rate"], "curve spawn_rate", 0, 1)
+    return speed, spawn_rate
+
+def _compile_level(entry, where, default_speed=None, default_spawn_rate=None):
+    _check_keys(entry, LEVEL_KEYS, where)
+    speed = _number(entry, "asteroid_speed", where, default=default_speed, minimum=0.1)
+    spawn_rate = _number(entry, "spawn_rate", where, default=default_spawn_rate)
+    if spawn_rate > 1:
+        raise WaveConfigError(f"{where}: 'spawn_rate' is a per-frame probability, got {spawn_rate!r}")
+    pattern = _choice(entry, "pattern", where, "single", SPAWN_PATTERNS)
+    powerup_drops = _number(entry, "powerup_drops", where, default=1, integer=True)
+
+    # Group scripted waves by frame so the game does a single dict lookup per frame
+    events = {}
+    waves = entry.get("waves", [])
+    if not isinstance(waves, list):
+        raise WaveConfigError(f"{where}: 'waves' must be a list")
+    for i, wave in enumerate(waves):
+        frame, event = _compile_event(wave, f"{where} wave {i + 1}", speed)
+        events.setdefault(frame, []).append(event)
+    events = {frame: tuple(group) for frame, group in events.items()}
+
+    return Level(float(speed), float(spawn_rate), SPAWN_PATTERNS[pattern], powerup_drops, events)
+
+def compile_wave_schedule(data, default_points_per_level):
+    _check_keys(data, FILE_KEYS, "level file")
+    points_per_level = _number(data, "points_per_level", "level file", default=default_points_per_level,
+                               integer=True, minimum=1)
+    curve = _compile_curve(data["curve"]) if "curve" in data else None
+    entries = data.get("levels", [])
+    if not isinstance(entries, list) or not (entries or curve):
+        raise WaveConfigError("level file: 'levels' must be a non-empty list")
+
+    if curve is None:
+        # Without a curve every level is spelled out and the last one repeats forever
+        levels = [_compile_level(entry, f"level {i + 1}") for i, entry in enumerate(entries)]
+        return WaveSchedule(levels, points_per_level)
+
+    # Levels may leave out speed and spawn rate to follow the curve, which keeps
+    # growing from whatever the previous level used
+    (speed, speed_growth), (spawn_rate, spawn_growth) = curve
+    levels = []
+    for i in range(max(len(entries), CURVE_LEVELS)):
+        if i < len(entries):
+            level = _compile_level(entries[i], f"level {i + 1}", speed, spawn_rate)
+        else:
+            level = Level(speed, spawn_rate, 1, 1, {})
+        levels.append(level)
+        speed = _grow(level.asteroid_speed, speed_growth)
+        spawn_rate = _grow(level.spawn_rate, spawn_growth)
+    return WaveSchedule(levels, points_per_level)
+
+def load_wave_schedule(default_points_per_level, path=WAVES_FILE):
+    with open(path, "r", encoding="utf-8") as file:
+        try:
+            data = json.load(file)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise WaveConfigError(f"{path}: {e}") from e
+    return compile_wave_schedule(data, default_points_per_level)
+
+def default_wave_schedule(asteroid_speed, spawn_rate, max_asteroid_speed, max_spawn_rate, points_per_level):
+    # Same curve the game used before levels were data-driven
+    return compile_wave_schedule({
+        "curve": {
+            "asteroid_speed": {"start": asteroid_speed, "step": 0.5, "cap": max_asteroid_speed},
+            "spawn_rate": {"start": spawn_rate, "step": 0.005, "cap": max_spawn_rate},
+        },
+    }, points_per_level)